@@ -3,4 +3,5 @@ import os
 # 모든 경로의 기준 (현재 파일 위치)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_PATH = os.path.join(BASE_DIR, "extracted_dialog_full.json")
+SNAPSHOT_PATH = os.path.join(BASE_DIR, "extracted_dialog_full.snapshot")
 AUDIO_DIR = os.path.join(BASE_DIR, "audio")
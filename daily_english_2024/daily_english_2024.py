@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 import streamlit as st
-import os, json, re, base64
+import os, re, base64
 from io import BytesIO
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.cidfonts import UnicodeCIDFont
-from config import DATA_PATH, AUDIO_DIR
+from config import DATA_PATH, SNAPSHOT_PATH, AUDIO_DIR
+from lesson_store import load_lessons, EMPTY_LESSON
 
 # ------------ 기본 설정 ------------
 st.set_page_config(page_title="왕초보 영어 2024 하편", layout="centered")
@@ -18,14 +19,18 @@ if not os.path.exists(DATA_PATH):
     st.error(f"❌ 데이터 파일이 없습니다: {os.path.abspath(DATA_PATH)}")
     st.stop()
 
-with open(DATA_PATH, "r", encoding="utf-8") as f:
-    data = json.load(f)
+@st.cache_resource(max_entries=1)
+def get_lessons(source_mtime):
+    """모든 세션이 공유하는 읽기 전용 레슨 저장소 (JSON이 바뀌면 다시 로드)"""
+    return load_lessons(DATA_PATH, SNAPSHOT_PATH)
+
+data = get_lessons(os.stat(DATA_PATH).st_mtime_ns)
 
 if not data:
     st.warning("⚠️ JSON 데이터가 비어 있습니다.")
     st.stop()
 
-day_list = sorted(data.keys())
+day_list = data.day_list
 
 # ------------ 유틸 함수 ------------
 def find_audio_file(day_number):
@@ -73,14 +78,14 @@ def make_pdf(day_key, lesson):
 
     content = []
     content.append(Paragraph(safe(f"왕초보 영어 {day_key}"), style_title))
-    content.append(Paragraph(safe(lesson.get("title","")), style_heading))
+    content.append(Paragraph(safe(lesson.title), style_heading))
 
     # 💬 Dialogue
     content.append(Spacer(1, 6))
     content.append(Paragraph("💬 Dialogue", style_heading))
-    dlg = lesson.get("dialogue", [])
-    if isinstance(dlg, list) and dlg:
-        dlg_text = "".join([f"<b>{d.get('speaker')}</b>: {d.get('en')}<br/>{d.get('ko')}<br/><br/>" for d in dlg])
+    dlg = lesson.dialogue
+    if dlg:
+        dlg_text = "".join([f"<b>{d.speaker}</b>: {d.en}<br/>{d.ko}<br/><br/>" for d in dlg])
     else:
         dlg_text = "내용 없음"
     content.append(Paragraph(safe(dlg_text), style_body))
@@ -88,14 +93,14 @@ def make_pdf(day_key, lesson):
     # 📘 핵심 표현
     content.append(Spacer(1, 6))
     content.append(Paragraph("📘 핵심 표현", style_heading))
-    patterns = lesson.get("patterns", [])
+    patterns = lesson.patterns
     patt_text = "<br/>".join([f"• {p}" for p in patterns]) if patterns else "없음"
     content.append(Paragraph(safe(patt_text), style_body))
 
     # ✍️ 손영작 연습
     content.append(Spacer(1, 6))
     content.append(Paragraph("✍️ 손영작 연습", style_heading))
-    practice = lesson.get("practice", [])
+    practice = lesson.practice
     prac_text = "<br/>".join([f"□ {p}" for p in practice]) if practice else "없음"
     content.append(Paragraph(safe(prac_text), style_body))
 
@@ -139,9 +144,9 @@ with col3:
 
 # ------------ 현재 DAY 표시 ------------
 day = st.session_state.current_day
-lesson = data.get(day, {})
+lesson = data.get(day, EMPTY_LESSON)
 
-st.header(f"{day} — {lesson.get('title', '')}")
+st.header(f"{day} — {lesson.title}")
 
 # 🎧 오디오
 num = day.split()[1]
@@ -154,19 +159,19 @@ else:
 st.markdown("")
 
 # 💬 Dialogue
-if lesson.get("dialogue"):
+if lesson.dialogue:
     st.subheader("💬 Dialogue")
-    for line in lesson["dialogue"]:
-        st.markdown(f"**{line.get('speaker','')}:** {line.get('en','')}")
-        st.markdown(f"👉 {line.get('ko','')}")
+    for line in lesson.dialogue:
+        st.markdown(f"**{line.speaker}:** {line.en}")
+        st.markdown(f"👉 {line.ko}")
         st.markdown("---")
 else:
     st.info("대화 내용이 없습니다.")
 
 # 📘 핵심 표현
-if lesson.get("patterns"):
+if lesson.patterns:
     st.subheader("📘 핵심 표현")
-    for p in lesson["patterns"]:
+    for p in lesson.patterns:
         st.markdown(f"- {p}")
 else:
     st.info("핵심 표현이 없습니다.")
@@ -174,9 +179,9 @@ else:
 st.markdown("")
 
 # ✍️ 손영작 연습
-if lesson.get("practice"):
+if lesson.practice:
     st.subheader("✍️ 손영작 연습")
-    for p in lesson["practice"]:
+    for p in lesson.practice:
         st.markdown(f"□ {p}")
 else:
     st.info("손영작 연습이 없습니다.")
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+import os
+import stat
+
+
+def target_file_mode(path):
+    """임시 파일로 교체할 대상 파일의 권한 (파일이 없으면 0o644)"""
+    # os.umask 로 읽으면 프로세스 전체 umask 가 잠깐 바뀌므로 쓰지 않음
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o644
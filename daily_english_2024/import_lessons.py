@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+여러 소스 파일(PDF 또는 페이지 텍스트 덤프)에서 DAY 데이터를 한꺼번에 가져옵니다.
+
+- asyncio 로 파일 경로를 나눠 주고, 읽기/PDF 추출/파싱은 프로세스 풀에서 병렬로 처리
+- 크기가 정해진 큐로 대기 중인 파일 수를 제한 (backpressure)
+- 결과는 기존 JSON에 DAY 단위로 병합 (다른 DAY는 그대로 유지)
+
+사용 예:
+    python import_lessons.py pdf_full_extracted.txt "[B] 왕초보 영어-2024 하편.pdf"
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from config import DATA_PATH
+from fileutil import target_file_mode
+from make_json_full import extract_text_from_pdf, parse_day_data
+
+DAY_NUMBER_RE = re.compile(r"^\d{3}$")
+
+
+def find_day_numbers(text):
+    """텍스트에 들어 있는 DAY 번호 목록을 찾습니다 ("DAY" 줄 뒤의 3자리 숫자)."""
+    lines = [line.strip() for line in text.split('\n')]
+    days = set()
+    for i, line in enumerate(lines):
+        if DAY_NUMBER_RE.match(line) and "DAY" in lines[max(0, i - 4):i]:
+            days.add(int(line))
+    return sorted(days)
+
+
+def load_pdf_text(path):
+    """PDF 텍스트 추출 (프로세스 풀에서 실행, 진행 로그는 숨김)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return extract_text_from_pdf(path)
+
+
+def parse_source_text(text):
+    """텍스트 하나에서 찾은 모든 DAY를 파싱합니다 (프로세스 풀에서 실행)."""
+    result = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for day_num in find_day_numbers(text):
+            day_data = parse_day_data(text, day_num)
+            # 본문(대화/패턴/연습)이 추출되지 않은 DAY는 기존 데이터를 덮어쓰지 않도록 제외
+            if day_data["dialogue"] or day_data["patterns"] or day_data["practice"]:
+                result[f"DAY {day_num:03d}"] = day_data
+    return result
+
+
+def read_text_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def import_source(path):
+    """소스 파일 하나를 읽고 파싱합니다 (프로세스 풀에서 실행, 파싱 결과만 돌려줌)."""
+    if path.lower().endswith(".pdf"):
+        text = load_pdf_text(path)
+    else:
+        text = read_text_file(path)
+    return parse_source_text(text)
+
+
+async def enqueue_sources(paths, queue):
+    """소스 경로를 큐에 넣습니다. 큐가 가득 차면 워커가 따라올 때까지 대기합니다."""
+    for index, path in enumerate(paths):
+        await queue.put((index, path))
+
+
+async def parse_worker(queue, pool, results, progress):
+    """큐에서 경로를 꺼내 프로세스 풀에서 읽기/추출/파싱을 수행합니다."""
+    loop = asyncio.get_running_loop()
+    while True:
+        index, path = await queue.get()
+        try:
+            days = {}
+            try:
+                days = await loop.run_in_executor(pool, import_source, path)
+            except Exception as e:
+                print(f"  [ERROR] {path} 처리 실패: {e}")
+            results[index] = days
+            progress["done"] += 1
+            print(f"[{progress['done']}/{progress['total']}] {os.path.basename(path)}: DAY {len(days)}개")
+        finally:
+            queue.task_done()
+
+
+async def import_sources(paths, workers, queue_size):
+    """모든 소스를 파싱해 입력 순서대로 DAY 데이터 목록을 돌려줍니다."""
+    queue = asyncio.Queue(maxsize=queue_size)
+    results = [{} for _ in paths]
+    progress = {"done": 0, "total": len(paths)}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tasks = [asyncio.create_task(parse_worker(queue, pool, results, progress))
+                 for _ in range(workers)]
+        await enqueue_sources(paths, queue)
+        await queue.join()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return results
+
+
+def merge_day(existing, day_data):
+    """DAY 하나를 필드 단위로 병합합니다 (비어 있는 필드는 기존 값 유지)."""
+    merged = dict(existing or {})
+    for field, value in day_data.items():
+        if value or not merged.get(field):
+            merged[field] = value
+    return merged
+
+
+def merge_days(json_path, results):
+    """파싱 결과를 기존 JSON에 DAY 단위로 병합하고, 원자적으로 저장합니다."""
+    data = {}
+    if os.path.exists(json_path):
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    updated = []
+    # 같은 DAY가 여러 파일에 있으면 나중에 지정한 파일이 우선
+    for days in results:
+        for day_key, day_data in days.items():
+            # 손으로 채운 필드를 빈 추출 결과로 지우지 않도록 필드 단위로 병합
+            data[day_key] = merge_day(data.get(day_key), day_data)
+            if day_key not in updated:
+                updated.append(day_key)
+
+    if not updated:
+        return []
+
+    data = dict(sorted(data.items()))
+
+    # 임시 파일에 쓴 뒤 교체 → 실행 중인 뷰어가 쓰다 만 파일을 읽지 않음
+    dir_name = os.path.dirname(os.path.abspath(json_path))
+    fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=dir_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        # mkstemp 는 0600 으로 만들므로 기존 파일 권한을 유지
+        os.chmod(tmp_path, target_file_mode(json_path))
+        os.replace(tmp_path, json_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return sorted(updated)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 PDF/텍스트 파일에서 DAY 데이터를 가져와 JSON에 병합합니다.")
+    parser.add_argument("sources", nargs="+", help="PDF 또는 페이지 텍스트 덤프(.txt) 파일")
+    parser.add_argument("--output", default=DATA_PATH, help="병합할 JSON 파일 (기본: config.DATA_PATH)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="파싱 프로세스 수")
+    parser.add_argument("--queue-size", type=int, default=None, help="대기 큐 크기 (기본: workers x 2)")
+    args = parser.parse_args()
+
+    workers = max(1, args.workers)
+    queue_size = args.queue_size or workers * 2
+
+    missing = [p for p in args.sources if not os.path.exists(p)]
+    if missing:
+        print(f"오류: 파일을 찾을 수 없습니다: {', '.join(missing)}")
+        return
+
+    print("=" * 70)
+    print(f"소스 {len(args.sources)}개 가져오기 시작 (workers={workers}, queue={queue_size})")
+    print("=" * 70)
+
+    results = asyncio.run(import_sources(args.sources, workers, queue_size))
+    updated = merge_days(args.output, results)
+
+    print(f"\n{'=' * 70}")
+    if updated:
+        print(f"완료! {args.output} 에 DAY {len(updated)}개를 병합했습니다.")
+        print(f"  {', '.join(updated[:10])}" + (" ..." if len(updated) > 10 else ""))
+    else:
+        print("추출된 DAY가 없어 JSON을 변경하지 않았습니다.")
+    print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    main()
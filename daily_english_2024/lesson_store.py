@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+뷰어용 읽기 전용 레슨 저장소
+
+JSON의 중첩 dict/list 대신 __slots__ 레코드와 튜플로 보관하고, 화자/패턴처럼
+반복되는 문자열은 intern 해서 공유합니다. JSON을 매번 파싱하지 않도록
+바이너리 스냅샷(marshal)을 JSON 옆에 만들어 두고, JSON이 바뀌면 다시 만듭니다.
+"""
+import json
+import marshal
+import os
+import sys
+import tempfile
+
+from fileutil import target_file_mode
+
+SNAPSHOT_VERSION = 1
+
+
+class DialogueLine:
+    """대화 한 줄 (speaker, en, ko)"""
+    __slots__ = ("speaker", "en", "ko")
+
+    def __init__(self, speaker, en, ko):
+        self.speaker = speaker
+        self.en = en
+        self.ko = ko
+
+
+class Lesson:
+    """DAY 하나의 학습 내용 (dialogue/patterns/practice 는 튜플)"""
+    __slots__ = ("title", "dialogue", "patterns", "practice")
+
+    def __init__(self, title, dialogue, patterns, practice):
+        self.title = title
+        self.dialogue = dialogue
+        self.patterns = patterns
+        self.practice = practice
+
+
+EMPTY_LESSON = Lesson("", (), (), ())
+
+
+class LessonStore:
+    """DAY 키 → Lesson 매핑 (읽기 전용)"""
+    __slots__ = ("_lessons", "day_list")
+
+    def __init__(self, lessons):
+        self._lessons = lessons
+        self.day_list = tuple(sorted(lessons))
+
+    def __len__(self):
+        return len(self._lessons)
+
+    def __contains__(self, day_key):
+        return day_key in self._lessons
+
+    def __getitem__(self, day_key):
+        return self._lessons[day_key]
+
+    def get(self, day_key, default=None):
+        return self._lessons.get(day_key, default)
+
+
+def _pack_lessons(data):
+    """JSON dict → 스냅샷에 저장할 튜플 구조 (반복 문자열은 intern)"""
+    packed = {}
+    for day_key, lesson in data.items():
+        dialogue = tuple(
+            (sys.intern(str(d.get("speaker", ""))), str(d.get("en", "")), str(d.get("ko", "")))
+            for d in lesson.get("dialogue", []) or []
+        )
+        patterns = tuple(sys.intern(str(p)) for p in lesson.get("patterns", []) or [])
+        practice = tuple(str(p) for p in lesson.get("practice", []) or [])
+        packed[day_key] = (str(lesson.get("title", "") or ""), dialogue, patterns, practice)
+    return packed
+
+
+def _unpack_lessons(packed):
+    """튜플 구조 → LessonStore (dict/tuple/str 이외의 값이 있으면 TypeError)"""
+    if type(packed) is not dict:
+        raise TypeError("스냅샷 구조가 올바르지 않습니다")
+    str_only = {str}
+    lessons = {}
+    for day_key, (title, dialogue, patterns, practice) in packed.items():
+        if (type(day_key) is not str or type(title) is not str
+                or type(dialogue) is not tuple or type(patterns) is not tuple or type(practice) is not tuple
+                or not set(map(type, patterns)) <= str_only or not set(map(type, practice)) <= str_only):
+            raise TypeError("스냅샷 구조가 올바르지 않습니다")
+        lines = []
+        for line in dialogue:
+            if type(line) is not tuple or not set(map(type, line)) <= str_only:
+                raise TypeError("스냅샷 구조가 올바르지 않습니다")
+            sp, en, ko = line
+            lines.append(DialogueLine(sys.intern(sp), en, ko))
+        lessons[sys.intern(day_key)] = Lesson(
+            title,
+            tuple(lines),
+            tuple(sys.intern(p) for p in patterns),
+            practice,
+        )
+    return LessonStore(lessons)
+
+
+def _source_stamp(json_path):
+    st = os.stat(json_path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_snapshot(snapshot_path, stamp):
+    """JSON과 맞는 스냅샷이면 튜플 구조를, 아니면 None을 돌려줍니다."""
+    # marshal 은 손상되거나 악의적인 데이터에 안전하지 않으므로, 이 모듈이 직접 쓴
+    # 스냅샷만 읽고 _unpack_lessons 에서 dict/tuple/str 구조인지 확인한 뒤 사용
+    try:
+        with open(snapshot_path, "rb") as f:
+            # 파일 객체에서 바로 marshal.load 하면 작은 조각으로 읽어 느림
+            snapshot = marshal.loads(f.read())
+    except Exception:
+        # 없거나 깨진 스냅샷은 JSON에서 다시 만듦
+        return None
+    if not isinstance(snapshot, dict):
+        return None
+    if (snapshot.get("version") != SNAPSHOT_VERSION
+            or snapshot.get("marshal_version") != marshal.version
+            or snapshot.get("source") != stamp):
+        return None
+    return snapshot.get("lessons")
+
+
+def build_snapshot(json_path, snapshot_path):
+    """JSON을 읽어 스냅샷 파일을 새로 만들고, 튜플 구조를 돌려줍니다."""
+    stamp = _source_stamp(json_path)
+    with open(json_path, "r", encoding="utf-8") as f:
+        packed = _pack_lessons(json.load(f))
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "marshal_version": marshal.version,
+        "source": stamp,
+        "lessons": packed,
+    }
+    # 여러 세션이 동시에 만들 수 있으므로 임시 파일에 쓴 뒤 교체
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix=".snapshot", dir=os.path.dirname(os.path.abspath(snapshot_path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(snapshot, f)
+            # mkstemp 는 0600 으로 만들므로 다른 사용자로 실행되는 뷰어도 읽을 수 있게 맞춤
+            os.chmod(tmp_path, target_file_mode(snapshot_path))
+            os.replace(tmp_path, snapshot_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # 쓰기 권한이 없으면 스냅샷 없이 진행 (다음 로드 때 JSON을 다시 파싱)
+        pass
+    return packed
+
+
+def load_lessons(json_path, snapshot_path):
+    """스냅샷이 최신이면 스냅샷에서, 아니면 JSON에서 LessonStore를 만듭니다."""
+    packed = _read_snapshot(snapshot_path, _source_stamp(json_path))
+    if packed is not None:
+        try:
+            return _unpack_lessons(packed)
+        except Exception:
+            # 구조가 맞지 않는 스냅샷은 버리고 다시 만듦
+            pass
+    return _unpack_lessons(build_snapshot(json_path, snapshot_path))
@@ -1,10 +1,20 @@
 import json
 import re
-import pdfplumber
 import os
 
+from text_script import (
+    line_features, split_dialogue,
+    EXAMPLE_SENTENCE_RE, KOREAN_SENTENCE_RE, PATTERN_SPLIT_RE, GRAMMAR_TERM_RE,
+)
+
+# 다음 DAY 섹션 시작을 찾을 때 쓰는 DAY 번호 줄 ("001" ~ "199")
+DAY_NUMBER_LINES = frozenset(f"{d:03d}" for d in range(1, 200))
+
 def extract_text_from_pdf(pdf_path):
     """PDF 파일에서 텍스트를 추출합니다."""
+    # 텍스트 덤프만 가져올 때는 pdfplumber 없이도 동작하도록 지연 import
+    import pdfplumber
+
     text = ""
     with pdfplumber.open(pdf_path) as pdf:
         print(f"총 {len(pdf.pages)} 페이지 추출 중...")
@@ -46,7 +56,7 @@ def extract_day_section(text, day_number):
     
     # 다음 DAY 섹션 찾기
     for i in range(day_number_idx + 3, len(lines)):
-        if lines[i].strip() in [f"{d:03d}" for d in range(1, 200)]:
+        if lines[i].strip() in DAY_NUMBER_LINES:
             end_idx = i - 2
             break
     
@@ -97,17 +107,8 @@ def parse_dialogue_from_step3(section_text):
                 speaker = parts[0].replace(':', '').strip()
                 content = parts[1]
                 
-                # 영어와 한글 분리
-                en_text = ""
-                ko_text = ""
-                
-                # 마침표나 물음표로 영어 문장 찾기
-                import re
-                # 영어 문장 패턴 (영어로 시작하고 마침표/물음표로 끝나는 것)
-                match = re.match(r'([A-Za-z,\s\'\.\?!]+)(?:\s*)(.*)$', content)
-                if match:
-                    en_text = match.group(1).strip()
-                    ko_text = match.group(2).strip()
+                # 영어와 한글 분리 (영어로 시작하는 부분 + 나머지 한글)
+                en_text, ko_text = split_dialogue(content)
                 
                 if en_text:
                     dialogue.append({
@@ -135,7 +136,6 @@ def parse_patterns_from_step3(section_text):
         return []
     
     # STEP3 이후 STEP4 전까지 패턴 찾기
-    import re
     i = step3_idx + 1
     
     while i < len(lines):
@@ -163,17 +163,16 @@ def parse_patterns_from_step3(section_text):
                     break
                 
                 # 패턴 설명 줄인지 확인
-                has_korean = any('\uac00' <= c <= '\ud7a3' for c in next_line)
-                has_english = any('a' <= c.lower() <= 'z' for c in next_line)
+                features = line_features(next_line)
                 
                 # 한글과 영어가 모두 있고, 콜론/괄호/물결표/+가 있으면 패턴으로 간주
-                if has_korean and has_english:
+                if features.hangul and features.latin:
                     # 패턴 특징: :, ~, (, +, . 등의 기호가 있음
-                    if ':' in next_line or '~' in next_line or '(' in next_line or '+' in next_line or '.' in next_line:
+                    if features.markers:
                         # 예문이 아닌지 확인 (예문은 보통 대문자로 시작하고 마침표로 끝남)
                         # 하지만 패턴 설명도 대문자로 시작할 수 있으므로, 
                         # 기호가 있고 길이가 적당하면 패턴으로 간주
-                        is_example = re.match(r'^[A-Z][a-z]+[^:+~\(\)]+[\.\?!]\s+[가-힣]+.*[\.\?!]?\s*$', next_line)
+                        is_example = EXAMPLE_SENTENCE_RE.match(next_line)
                         if not is_example:
                             pattern_candidate = next_line
                             # 다음 줄이 한글 번역인 경우도 있으므로 확인
@@ -181,10 +180,10 @@ def parse_patterns_from_step3(section_text):
                             if i < len(lines) and lines[i].strip() and not lines[i].strip().startswith('A:') and not lines[i].strip().startswith('B:'):
                                 next_next_line = lines[i].strip()
                                 # 순수 한글 줄이면 패턴 설명의 일부로 간주
-                                has_only_korean = all('\uac00' <= c <= '\ud7a3' or c in ' .?!,~:()-/' for c in next_next_line if c.strip())
+                                has_only_korean = line_features(next_next_line).only_korean
                                 if has_only_korean and len(next_next_line) > 0:
                                     # 한글 줄이 패턴의 연속인지 예문인지 확인
-                                    if not re.match(r'^[가-힣\s]+[\.\?!]\s*$', next_next_line):
+                                    if not KOREAN_SENTENCE_RE.match(next_next_line):
                                         i -= 1  # 다시 돌아감
                             
                             if pattern_candidate:
@@ -231,31 +230,13 @@ def parse_practice_from_step4(section_text):
 
 def clean_pattern(pattern):
     """패턴을 정리합니다 (품사 표현을 ~로 치환, 콜론 정리)"""
-    import re
-    
     # 1. 품사 표현을 ~로 치환
-    grammar_terms = [
-        r'\(동사원형\)',
-        r'\(동사\)',
-        r'\(명사\)',
-        r'\(형용사\)',
-        r'\(주어\)',
-        r'\(목적어\)',
-        r'\(평서문\)',
-        r'\(질문 어순\)',
-        r'\(날/날짜/요일\)',
-        r'\(날/요일\)',
-        r'\(기간\)',
-        r'\(장소\)',
-    ]
-    
-    for term in grammar_terms:
-        pattern = re.sub(term, '~', pattern)
+    pattern = GRAMMAR_TERM_RE.sub('~', pattern)
     
     # 2. 콜론이 없으면 영어와 한글 사이에 추가
     if ':' not in pattern:
         # 영어 부분 끝을 찾기 (한글 직전까지)
-        match = re.match(r'^([A-Za-z0-9\s\+\-\(\)\[\]\{\}\'\"/.,!?~]+?)\s+([가-힣].*)$', pattern)
+        match = PATTERN_SPLIT_RE.match(pattern)
         if match:
             english_part = match.group(1).strip()
             korean_part = match.group(2).strip()
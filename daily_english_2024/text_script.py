@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+줄 단위 문자 종류(한글/영어) 판별 도우미
+
+make_json_full.py 의 대화/패턴 분리와 clean_pattern 에서 같은 줄을 여러 번
+검사하므로, 미리 컴파일한 정규식으로 한 번에 특징을 계산하고 줄마다 캐시합니다.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+HANGUL_RE = re.compile('[가-힣]')
+LATIN_RE = re.compile('[A-Za-z]')
+# 한글 음절, 공백, 일부 문장부호 이외의 문자 (없으면 "한글만 있는 줄")
+NON_KOREAN_TEXT_RE = re.compile(r'[^\s가-힣 .?!,~:()\-/]')
+
+# 패턴 설명 줄에 주로 나오는 기호
+PATTERN_MARKERS = ':~(+.'
+
+# 대화 줄: 영어 문장 + 한글 번역
+DIALOGUE_SPLIT_RE = re.compile(r'([A-Za-z,\s\'\.\?!]+)(?:\s*)(.*)$')
+# 예문 (대문자로 시작하고 문장부호로 끝나는 영어 + 한글 번역)
+EXAMPLE_SENTENCE_RE = re.compile(r'^[A-Z][a-z]+[^:+~\(\)]+[\.\?!]\s+[가-힣]+.*[\.\?!]?\s*$')
+# 순수 한글 문장
+KOREAN_SENTENCE_RE = re.compile(r'^[가-힣\s]+[\.\?!]\s*$')
+# 콜론 없는 패턴의 영어/한글 경계
+PATTERN_SPLIT_RE = re.compile(r'^([A-Za-z0-9\s\+\-\(\)\[\]\{\}\'\"/.,!?~]+?)\s+([가-힣].*)$')
+# ~로 치환할 품사 표현
+GRAMMAR_TERM_RE = re.compile('|'.join(re.escape(term) for term in [
+    '(동사원형)',
+    '(동사)',
+    '(명사)',
+    '(형용사)',
+    '(주어)',
+    '(목적어)',
+    '(평서문)',
+    '(질문 어순)',
+    '(날/날짜/요일)',
+    '(날/요일)',
+    '(기간)',
+    '(장소)',
+]))
+
+LineFeatures = namedtuple('LineFeatures', [
+    'length',        # 공백 제외 글자 수
+    'hangul',        # 한글 음절 수
+    'latin',         # 영문자 수
+    'hangul_ratio',  # hangul / length
+    'latin_ratio',   # latin / length
+    'only_korean',   # 한글과 문장부호만 있는지
+    'markers',       # 줄에 있는 PATTERN_MARKERS 기호 (frozenset)
+])
+
+
+@lru_cache(maxsize=65536)
+def line_features(line):
+    """줄의 문자 종류 특징을 계산합니다 (같은 줄은 캐시된 결과 사용)."""
+    length = len(''.join(line.split()))
+    hangul = len(HANGUL_RE.findall(line))
+    latin = len(LATIN_RE.findall(line))
+    return LineFeatures(
+        length=length,
+        hangul=hangul,
+        latin=latin,
+        hangul_ratio=hangul / length if length else 0.0,
+        latin_ratio=latin / length if length else 0.0,
+        only_korean=NON_KOREAN_TEXT_RE.search(line) is None,
+        markers=frozenset(c for c in PATTERN_MARKERS if c in line),
+    )
+
+
+@lru_cache(maxsize=65536)
+def split_dialogue(content):
+    """대화 내용을 (영어, 한글)로 나눕니다. 영어 부분이 없으면 ("", "")"""
+    match = DIALOGUE_SPLIT_RE.match(content)
+    if not match:
+        return "", ""
+    return match.group(1).strip(), match.group(2).strip()